@@ -9,6 +9,8 @@ from core.models import (
     Vacancy,
     Resume,
     SpecialistTechnology,
+    ArchivedVacancy,
+    ArchivedResume,
 )
 
 
@@ -35,7 +37,7 @@ class CountryAdmin(admin.ModelAdmin):
 class CompanyAdmin(admin.ModelAdmin):
     list_display = ('name', 'country', 'town', 'foundation_date', 'site_href')
     list_filter = ('name', 'country', 'town')
-    search_fields = ('name', 'country', 'town')
+    search_fields = ('name', 'country__name', 'town__name')
 
 
 @admin.register(Technology)
@@ -54,7 +56,7 @@ class SpecialistAdmin(admin.ModelAdmin):
     inlines = (SpecialistTechnologyInline,)
     list_display = ('name', 'surname', 'patronymic', 'country', 'town')
     list_filter = ('name', 'surname', 'country', 'town')
-    search_fields = ('name', 'surname', 'country', 'town')
+    search_fields = ('name', 'surname', 'country__name', 'town__name')
 
 
 @admin.register(Vacancy)
@@ -62,7 +64,7 @@ class VacancyAdmin(admin.ModelAdmin):
     exclude = ('published_datetime',)
     list_display = ('name', 'company', 'town', 'salary', 'description')
     list_filter = ('name', 'company', 'town', 'salary')
-    search_fields = ('name', 'company', 'town', 'salary')
+    search_fields = ('name', 'company__name', 'town__name', 'salary')
 
 
 @admin.register(Resume)
@@ -70,4 +72,18 @@ class ResumeAdmin(admin.ModelAdmin):
     exclude = ('published_datetime',)
     list_display = ('position', 'specialist', 'salary')
     list_filter = ('position', 'specialist', 'salary')
-    search_fields = ('position', 'specialist', 'salary')
+    search_fields = ('position', 'specialist__surname', 'salary')
+
+
+@admin.register(ArchivedVacancy)
+class ArchivedVacancyAdmin(admin.ModelAdmin):
+    list_display = ('name', 'company', 'town', 'salary', 'archived_datetime')
+    list_filter = ('archived_datetime',)
+    search_fields = ('name',)
+
+
+@admin.register(ArchivedResume)
+class ArchivedResumeAdmin(admin.ModelAdmin):
+    list_display = ('position', 'specialist', 'salary', 'archived_datetime')
+    list_filter = ('archived_datetime',)
+    search_fields = ('position',)
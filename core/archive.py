@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+from time import monotonic, sleep
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from core.models import ArchivedResume, ArchivedVacancy, ChangeLog, Resume, Vacancy
+from core.signals import skip_delete_log
+
+ARCHIVE_MODELS = {
+    Vacancy: ArchivedVacancy,
+    Resume: ArchivedResume,
+}
+
+
+def get_cutoff(retention: timedelta | None = None) -> datetime:
+    if retention is None:
+        retention = timedelta(days=settings.ARCHIVE_RETENTION_DAYS)
+    return timezone.now() - retention
+
+
+def stale_q(cutoff: datetime) -> models.Q:
+    # Неопубликованные записи, которые давно не менялись,
+    # и опубликованные записи, срок публикации которых истёк.
+    return models.Q(updated_datetime__lt=cutoff) & (
+        models.Q(published_datetime__isnull=True)
+        | models.Q(published_datetime__lt=cutoff)
+    )
+
+
+def get_copied_fields(model: type[models.Model]) -> list[str]:
+    archive_model = ARCHIVE_MODELS[model]
+    return [
+        field.attname
+        for field in archive_model._meta.concrete_fields
+        if field.name != 'archived_datetime'
+    ]
+
+
+def archive_batch(model: type[models.Model], cutoff: datetime, batch_size: int) -> int:
+    archive_model = ARCHIVE_MODELS[model]
+    fields = get_copied_fields(model)
+    with transaction.atomic():
+        rows = list(
+            model.objects.select_for_update(skip_locked=True)
+            .filter(stale_q(cutoff))
+            .order_by('pk')
+            .values(*fields)[:batch_size]
+        )
+        if not rows:
+            return 0
+        archive_model.objects.bulk_create(
+            objs=(archive_model(**row) for row in rows),
+            batch_size=batch_size,
+        )
+        pks = [row['id'] for row in rows]
+        # Перенос пишется в журнал действием archive, а не delete;
+        # каскады, если появятся, выполняются и журналируются как обычно.
+        with skip_delete_log(model):
+            model.objects.filter(pk__in=pks).delete()
+        ChangeLog.record(model, pks, ChangeLog.ARCHIVE)
+    return len(rows)
+
+
+def archive_stale(
+    model: type[models.Model],
+    retention: timedelta | None = None,
+    batch_size: int = 500,
+    pause: float = 0.1,
+    max_batches: int | None = None,
+) -> int:
+    '''
+    Переносит устаревшие записи в архивную таблицу пачками по batch_size.
+    Каждая пачка переносится в отдельной транзакции, между пачками
+    выдерживается пауза не меньше pause и не меньше времени самой пачки,
+    чтобы блокировки держались недолго и не мешали основной нагрузке.
+    '''
+    cutoff = get_cutoff(retention)
+    archived = 0
+    batches = 0
+    while True:
+        started = monotonic()
+        count = archive_batch(model, cutoff, batch_size)
+        archived += count
+        batches += 1
+        if count < batch_size or (max_batches is not None and batches >= max_batches):
+            break
+        sleep(max(pause, monotonic() - started))
+    return archived
+
+
+def count_stale(model: type[models.Model], retention: timedelta | None = None) -> int:
+    return model.objects.filter(stale_q(get_cutoff(retention))).count()
+
+
+def restore(model: type[models.Model], pks: list[int]) -> int:
+    archive_model = ARCHIVE_MODELS[model]
+    fields = get_copied_fields(model)
+    with transaction.atomic():
+        rows = list(archive_model.objects.filter(pk__in=pks).values(*fields))
+        # _base_manager не пишет в журнал create/update, возврат из архива
+        # записывается одним действием restore.
+        objs = model._base_manager.bulk_create(objs=[model(**row) for row in rows])
+        # auto_now/auto_now_add перезаписывают даты при вставке, возвращаем исходные.
+        for obj, row in zip(objs, rows):
+            obj.created_datetime = row['created_datetime']
+            obj.updated_datetime = row['updated_datetime']
+        model._base_manager.bulk_update(objs, ['created_datetime', 'updated_datetime'])
+        ChangeLog.record(model, [obj.pk for obj in objs], ChangeLog.RESTORE)
+        archive_model.objects.filter(pk__in=pks).delete()
+    return len(rows)
+
+
+def listing(
+    model: type[models.Model],
+    *fields: str,
+    include_archived: bool = False,
+    **filters,
+) -> models.QuerySet:
+    '''
+    Возвращает values()-выборку по живой таблице, а при include_archived
+    объединяет её через UNION ALL с архивной таблицей. Каждая строка
+    содержит признак is_archived.
+    '''
+    if not fields:
+        fields = tuple(get_copied_fields(model))
+    queryset = (
+        model.objects.filter(**filters)
+        .annotate(is_archived=models.Value(False))
+        .values(*fields, 'is_archived')
+    )
+    if not include_archived:
+        return queryset
+    archived = (
+        ARCHIVE_MODELS[model]
+        .objects.filter(**filters)
+        .annotate(is_archived=models.Value(True))
+        .values(*fields, 'is_archived')
+    )
+    return queryset.union(archived, all=True)
@@ -0,0 +1,91 @@
+from collections.abc import Callable, Iterable, Iterator
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from core.models import ChangeLog, ChangeLogConsumer
+
+
+def read_changes(
+    after: int = 0,
+    limit: int = 500,
+    model_labels: Iterable[str] | None = None,
+) -> list[ChangeLog]:
+    '''
+    Возвращает до limit записей журнала с id больше after в порядке id.
+    id последней записи служит курсором для следующего вызова.
+
+    id выдаются при вставке, а транзакции фиксируются в другом порядке,
+    поэтому записи моложе CHANGELOG_COMMIT_LAG секунд не читаются: иначе
+    курсор может уйти дальше ещё не зафиксированной записи с меньшим id.
+    Транзакция, которая пишет в журнал дольше этого окна, всё равно может
+    быть пропущена; на SQLite записи упорядочены, и окно можно обнулить.
+    '''
+    lag = timedelta(seconds=settings.CHANGELOG_COMMIT_LAG)
+    queryset = ChangeLog.objects.filter(
+        id__gt=after, created_datetime__lte=timezone.now() - lag
+    )
+    if model_labels:
+        queryset = queryset.filter(model__in=list(model_labels))
+    return list(queryset.order_by('id')[:limit])
+
+
+def iter_changes(
+    after: int = 0,
+    batch_size: int = 500,
+    model_labels: Iterable[str] | None = None,
+) -> Iterator[list[ChangeLog]]:
+    while changes := read_changes(after, batch_size, model_labels):
+        yield changes
+        after = changes[-1].id
+
+
+def get_position(consumer: str) -> int:
+    position = (
+        ChangeLogConsumer.objects.filter(name=consumer)
+        .values_list('position', flat=True)
+        .first()
+    )
+    return position or 0
+
+
+def set_position(consumer: str, position: int) -> None:
+    ChangeLogConsumer.objects.update_or_create(
+        name=consumer, defaults={'position': position}
+    )
+
+
+def consume(
+    consumer: str,
+    handler: Callable[[list[ChangeLog]], None],
+    batch_size: int = 500,
+    model_labels: Iterable[str] | None = None,
+    max_batches: int | None = None,
+) -> int:
+    '''
+    Передаёт handler новые для consumer изменения пачками и после каждой
+    успешно обработанной пачки сохраняет курсор. Если handler упадёт,
+    пачка будет прочитана повторно (доставка "хотя бы один раз").
+    '''
+    consumed = 0
+    batches = iter_changes(get_position(consumer), batch_size, model_labels)
+    for number, changes in enumerate(batches, start=1):
+        handler(changes)
+        set_position(consumer, changes[-1].id)
+        consumed += len(changes)
+        if max_batches is not None and number >= max_batches:
+            break
+    return consumed
+
+
+def prune_changes() -> int:
+    '''
+    Удаляет записи журнала, уже прочитанные всеми потребителями.
+    '''
+    position = ChangeLogConsumer.objects.aggregate(models.Min('position'))
+    if position['position__min'] is None:
+        return 0
+    deleted, _ = ChangeLog.objects.filter(id__lte=position['position__min']).delete()
+    return deleted
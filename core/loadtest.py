@@ -0,0 +1,433 @@
+import asyncio
+import logging
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.header import decode_header, make_header
+from random import Random
+from time import perf_counter
+from urllib.parse import urlencode, urlsplit
+
+from django.contrib.admin.models import LogEntry
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.db import connection, models
+
+from core.models import CURRENCY, Resume, Vacancy
+
+QUERY_COUNT_HEADER = 'X-Query-Count'
+ERROR_HEADER = 'X-Load-Test-Error'
+
+DEFAULT_MIX = {
+    'changelist': 2,
+    'listing': 4,
+    'search': 2,
+    'detail': 3,
+    'write': 1,
+}
+
+CHANGELIST_MODELS = ('company', 'specialist', 'vacancy', 'resume', 'town')
+
+# Поля вакансий, которые запросы write меняют и которые возвращаются после прогона.
+WRITE_RESTORED_FIELDS = (
+    'id',
+    'name',
+    'company_id',
+    'town_id',
+    'salary',
+    'salary_currency',
+    'description',
+)
+
+WRITE_POOL_SIZE = 100
+
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class QueryCountMiddleware:
+    '''
+    Подключается только командой load_test: считает SQL-запросы на каждый
+    запрос и отключает проверку CSRF, как это делает django.test.Client.
+    '''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request._dont_enforce_csrf_checks = True
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            response = self.get_response(request)
+        response[QUERY_COUNT_HEADER] = str(queries)
+        if error := getattr(request, '_load_test_error', None):
+            response[ERROR_HEADER] = error
+        return response
+
+    def process_exception(self, request, exception):
+        message = ' '.join(str(exception).split())
+        request._load_test_error = f'{type(exception).__name__}: {message}'
+
+
+class FirstErrorFilter(logging.Filter):
+    '''
+    Пропускает в лог django.request только первую запись каждой ошибки
+    (трассировки - по исключению, предупреждения 4xx - по тексту), чтобы
+    повторы не заваливали консоль во время прогона.
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self.seen = set()
+
+    def filter(self, record):
+        if record.exc_info:
+            exc_type, exc, _ = record.exc_info
+            key = (exc_type, str(exc))
+        else:
+            key = record.getMessage()
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+
+@dataclass
+class Request:
+    kind: str
+    method: str
+    path: str
+    query: str = ''
+    body: bytes = b''
+    expected_status: int = 200
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str]
+
+
+@dataclass
+class Stats:
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+    first_error: str | None = None
+
+    def add_error(self, message: str):
+        self.errors += 1
+        if self.first_error is None:
+            self.first_error = message
+
+    @property
+    def successes(self) -> int:
+        return sum(self.statuses.values()) - self.errors
+
+    def percentile(self, value: float) -> float:
+        latencies = sorted(self.latencies_ms)
+        index = min(len(latencies) - 1, int(len(latencies) * value))
+        return latencies[index]
+
+    def histogram(self) -> list[int]:
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for latency in self.latencies_ms:
+            counts[bisect_left(HISTOGRAM_BUCKETS_MS, latency)] += 1
+        return counts
+
+
+class TrafficMix:
+    '''
+    Генерирует запросы к админке по весам mix на данных, созданных
+    generate_test_data. Данные для путей читаются из базы один раз.
+    '''
+
+    def __init__(self, mix: dict[str, int], seed: int | None = None):
+        self.kinds = list(mix)
+        self.weights = list(mix.values())
+        self.random = Random(seed)
+        self.pending = []
+        self.vacancies = list(Vacancy.objects.values('id', 'name'))
+        # Для записи нужны все поля формы, поэтому полностью читается только
+        # ограниченная выборка вакансий; она же хранит исходные значения.
+        pool = self.random.sample(
+            [vacancy['id'] for vacancy in self.vacancies],
+            min(WRITE_POOL_SIZE, len(self.vacancies)),
+        )
+        self.write_pool = list(
+            Vacancy.objects.filter(pk__in=pool)
+            .order_by('pk')
+            .values(*WRITE_RESTORED_FIELDS)
+        )
+        self.written = set()
+        self.resume_ids = list(Resume.objects.values_list('id', flat=True))
+        self.search_terms = sorted(
+            {word for vacancy in self.vacancies for word in vacancy['name'].split()}
+        )
+        self.pages = {
+            'vacancy': len(self.vacancies) // 100 + 1,
+            'resume': len(self.resume_ids) // 100 + 1,
+        }
+
+    def cover_all(self) -> int:
+        # Следующие запросы будут по одному каждого типа с ненулевым весом.
+        self.pending = [
+            kind for kind, weight in zip(self.kinds, self.weights) if weight
+        ]
+        return len(self.pending)
+
+    def next(self) -> Request:
+        if self.pending:
+            kind = self.pending.pop(0)
+        else:
+            kind = self.random.choices(self.kinds, self.weights)[0]
+        return getattr(self, f'make_{kind}')()
+
+    def make_changelist(self) -> Request:
+        model = self.random.choice(CHANGELIST_MODELS)
+        return Request('changelist', 'GET', f'/admin/core/{model}/')
+
+    def make_listing(self) -> Request:
+        model = self.random.choice(list(self.pages))
+        page = self.random.randint(1, self.pages[model])
+        return Request(
+            'listing', 'GET', f'/admin/core/{model}/', urlencode({'p': page})
+        )
+
+    def make_search(self) -> Request:
+        term = self.random.choice(self.search_terms)
+        return Request('search', 'GET', '/admin/core/vacancy/', urlencode({'q': term}))
+
+    def make_detail(self) -> Request:
+        if self.resume_ids and self.random.random() < 0.5:
+            path = f'/admin/core/resume/{self.random.choice(self.resume_ids)}/change/'
+        else:
+            path = f'/admin/core/vacancy/{self.random.choice(self.vacancies)["id"]}/change/'
+        return Request('detail', 'GET', path)
+
+    def make_write(self) -> Request:
+        vacancy = self.random.choice(self.write_pool)
+        self.written.add(vacancy['id'])
+        body = urlencode(
+            {
+                'name': vacancy['name'],
+                'company': vacancy['company_id'],
+                'town': vacancy['town_id'],
+                'salary': self.random.randint(1000, 20000),
+                'salary_currency': self.random.choice(CURRENCY)[0],
+                'description': vacancy['description'],
+                '_save': '1',
+            }
+        ).encode()
+        return Request(
+            'write',
+            'POST',
+            f'/admin/core/vacancy/{vacancy["id"]}/change/',
+            body=body,
+            expected_status=302,
+        )
+
+
+@contextmanager
+def preserved_data(traffic: TrafficMix, user):
+    '''
+    Возвращает изменённые запросами write вакансии к исходным значениям,
+    чтобы следующий прогон начинался с тех же данных. Возврат идёт через
+    Vacancy.objects и попадает в журнал изменений как update: записи журнала
+    не удаляются. Из журнала админки удаляются только записи прогона,
+    сделанные от имени user.
+    '''
+    logentry_id = LogEntry.objects.aggregate(models.Max('id'))['id__max'] or 0
+    try:
+        yield
+    finally:
+        vacancies = [
+            Vacancy(**vacancy)
+            for vacancy in traffic.write_pool
+            if vacancy['id'] in traffic.written
+        ]
+        Vacancy.objects.bulk_update(vacancies, WRITE_RESTORED_FIELDS[1:])
+        LogEntry.objects.filter(id__gt=logentry_id, user=user).delete()
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for item in value.split(','):
+        kind, _, weight = item.partition('=')
+        kind = kind.strip()
+        if kind not in DEFAULT_MIX:
+            raise ValueError(f'Неизвестный тип запроса: {kind}')
+        mix[kind] = int(weight)
+    if not any(mix.values()):
+        raise ValueError('Хотя бы один тип запроса должен иметь ненулевой вес')
+    return mix
+
+
+class ASGITransport:
+    '''
+    Вызывает ASGI-приложение в том же процессе, без сети.
+    '''
+
+    def __init__(self, application, headers: dict[str, str]):
+        self.application = application
+        self.headers = [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ]
+
+    async def send(self, request: Request) -> Response:
+        headers = [*self.headers]
+        if request.body:
+            headers += [
+                (b'content-type', b'application/x-www-form-urlencoded'),
+                (b'content-length', str(len(request.body)).encode()),
+            ]
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': request.method,
+            'scheme': 'http',
+            'path': request.path,
+            'raw_path': request.path.encode(),
+            'query_string': request.query.encode(),
+            'root_path': '',
+            'headers': headers,
+            'client': ('127.0.0.1', 0),
+            'server': ('localhost', 80),
+        }
+        messages = [{'type': 'http.request', 'body': request.body, 'more_body': False}]
+        finished = asyncio.Event()
+        response = Response(status=0, headers={})
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response.status = message['status']
+                response.headers = {
+                    name.decode().lower(): value.decode()
+                    for name, value in message['headers']
+                }
+            elif not message.get('more_body', False):
+                finished.set()
+
+        await self.application(scope, receive, send)
+        finished.set()
+        return response
+
+    def close(self):
+        pass
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class HTTPTransport:
+    '''
+    Отправляет запросы по HTTP. Если url не указан, поднимает локальный
+    многопоточный WSGI-сервер (как runserver) на свободном порту.
+    '''
+
+    def __init__(self, headers: dict[str, str], url: str | None = None, app=None):
+        self.headers = headers
+        self.server = None
+        if url is None:
+            self.server = ThreadedWSGIServer(
+                ('127.0.0.1', 0), QuietWSGIRequestHandler, allow_reuse_address=False
+            )
+            self.server.set_app(app)
+            self.server.daemon_threads = True
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            url = f'http://127.0.0.1:{self.server.server_port}'
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.url = url
+
+    async def send(self, request: Request) -> Response:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        target = f'{request.path}?{request.query}' if request.query else request.path
+        headers = {
+            **self.headers,
+            'Host': f'{self.host}:{self.port}',
+            'Connection': 'close',
+            'Content-Length': str(len(request.body)),
+        }
+        if request.body:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        head = f'{request.method} {target} HTTP/1.1\r\n'
+        head += ''.join(f'{name}: {value}\r\n' for name, value in headers.items())
+        writer.write(head.encode('latin-1') + b'\r\n' + request.body)
+        await writer.drain()
+        try:
+            status_line = await reader.readline()
+            response = Response(status=int(status_line.split()[1]), headers={})
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                name, _, value = line.decode('latin-1').partition(':')
+                response.headers[name.strip().lower()] = value.strip()
+            await reader.read()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+async def run_load(
+    transport,
+    traffic: TrafficMix,
+    concurrency: int,
+    requests: int,
+    duration: float | None = None,
+) -> tuple[dict[str, Stats], float]:
+    stats = defaultdict(Stats)
+    remaining = requests
+    started = perf_counter()
+    deadline = None if duration is None else started + duration
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0 and (deadline is None or perf_counter() < deadline):
+            remaining -= 1
+            request = traffic.next()
+            request_stats = stats[request.kind]
+            request_started = perf_counter()
+            try:
+                response = await transport.send(request)
+            except Exception as exc:
+                request_stats.statuses['exception'] += 1
+                request_stats.add_error(f'{type(exc).__name__}: {exc}')
+                continue
+            request_stats.latencies_ms.append((perf_counter() - request_started) * 1000)
+            request_stats.statuses[response.status] += 1
+            if response.status != request.expected_status:
+                error = response.headers.get(ERROR_HEADER.lower())
+                request_stats.add_error(
+                    str(make_header(decode_header(error)))
+                    if error
+                    else f'HTTP {response.status}, ожидался {request.expected_status}'
+                )
+            if QUERY_COUNT_HEADER.lower() in response.headers:
+                request_stats.queries.append(
+                    int(response.headers[QUERY_COUNT_HEADER.lower()])
+                )
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return dict(stats), perf_counter() - started
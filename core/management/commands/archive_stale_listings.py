@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from core.archive import ARCHIVE_MODELS, archive_stale, count_stale
+
+
+class Command(BaseCommand):
+    help = 'Перенос устаревших вакансий и резюме в архивные таблицы'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=settings.ARCHIVE_RETENTION_DAYS,
+            help='Сколько дней хранить записи в основных таблицах',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.ARCHIVE_BATCH_SIZE,
+            help='Количество записей, переносимых в одной транзакции',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=settings.ARCHIVE_BATCH_PAUSE,
+            help='Минимальная пауза между транзакциями в секундах',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help='Максимальное количество пачек для каждой модели',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только посчитать устаревшие записи',
+        )
+
+    def handle(self, *args, **options):
+        retention = timedelta(days=options['retention_days'])
+        for model in ARCHIVE_MODELS:
+            name = model._meta.verbose_name_plural
+            if options['dry_run']:
+                count = count_stale(model, retention)
+                self.stdout.write(f'{name}: к архивации {count}')
+                continue
+            count = archive_stale(
+                model,
+                retention=retention,
+                batch_size=options['batch_size'],
+                pause=options['pause'],
+                max_batches=options['max_batches'],
+            )
+            self.stdout.write(self.style.SUCCESS(f'{name}: перенесено в архив {count}'))
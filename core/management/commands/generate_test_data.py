@@ -1,12 +1,13 @@
 from datetime import date
+from functools import cached_property
 from random import choice, randint
 
-from dateutil.relativedelta import relativedelta
 from django.core.management import BaseCommand
-from faker import Faker
 
 from core.models import (
     CURRENCY,
+    min_age,
+    years_ago,
     Country,
     Town,
     Company,
@@ -27,7 +28,13 @@ class Command(BaseCommand):
     specialists_count = 10
 
     help = 'Генерация тестовых записей'
-    faker = Faker('ru_RU')
+
+    @cached_property
+    def faker(self):
+        # faker импортируется долго, поэтому загружаем его только при запуске.
+        from faker import Faker
+
+        return Faker('ru_RU')
 
     def handle(self, *args, **kwargs):
         self.insert_countries()
@@ -74,7 +81,7 @@ class Command(BaseCommand):
 
     def insert_specialists(self):
         start_born_date = date(1970, 1, 1)
-        end_born_date = date.today() - relativedelta(years=18)
+        end_born_date = years_ago(min_age)
         towns = Town.objects.values('id', 'country_id')
         objs = (
             Specialist(
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from core.loadtest import (
+    DEFAULT_MIX,
+    HISTOGRAM_BUCKETS_MS,
+    ASGITransport,
+    FirstErrorFilter,
+    HTTPTransport,
+    TrafficMix,
+    parse_mix,
+    preserved_data,
+    run_load,
+)
+from core.models import Vacancy
+
+
+class Command(BaseCommand):
+    help = 'Нагрузочное тестирование админки на данных generate_test_data'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--mode',
+            choices=('asgi', 'http'),
+            default='asgi',
+            help='asgi - it_job.asgi в этом процессе, '
+            'http - it_job.wsgi на локальном HTTP-сервере',
+        )
+        parser.add_argument(
+            '--url',
+            help='Адрес уже запущенного сервера для режима http',
+        )
+        parser.add_argument(
+            '--mix',
+            default=','.join(
+                f'{kind}={weight}' for kind, weight in DEFAULT_MIX.items()
+            ),
+            help='Веса типов запросов, например listing=4,detail=3,write=1',
+        )
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=1000,
+            help='Общее количество запросов',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=None,
+            help='Ограничение по времени в секундах',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=20,
+            help='Количество запросов прогрева, не попадающих в отчёт',
+        )
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument(
+            '--username',
+            help='Суперпользователь, от имени которого идут запросы',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            mix = parse_mix(options['mix'])
+        except ValueError as exc:
+            raise CommandError(exc)
+        if options['url'] and options['mode'] != 'http':
+            raise CommandError('--url можно указать только с --mode http')
+        if not Vacancy.objects.exists():
+            raise CommandError('Нет данных, выполните generate_test_data')
+
+        user, session_key = self.login(options)
+        headers = {'Cookie': f'{settings.SESSION_COOKIE_NAME}={session_key}'}
+        traffic = TrafficMix(mix, options['seed'])
+
+        with preserved_data(traffic, user), override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'localhost', '127.0.0.1'],
+            MIDDLEWARE=['core.loadtest.QueryCountMiddleware', *settings.MIDDLEWARE],
+        ):
+            if options['mode'] == 'asgi':
+                application = import_module('it_job.asgi').application
+                transport = ASGITransport(application, headers)
+            else:
+                application = None
+                if not options['url']:
+                    application = import_module('it_job.wsgi').application
+                transport = HTTPTransport(headers, options['url'], application)
+                self.stdout.write(f'Сервер: {transport.url}')
+            # Первая ошибка каждого типа запросов попадает в отчёт, в консоль
+            # выводится только первая трассировка каждой ошибки.
+            request_logger = logging.getLogger('django.request')
+            error_filter = FirstErrorFilter()
+            request_logger.addFilter(error_filter)
+            try:
+                if options['warmup']:
+                    kinds = traffic.cover_all()
+                    warmup_stats, _ = asyncio.run(
+                        run_load(
+                            transport,
+                            traffic,
+                            options['concurrency'],
+                            max(options['warmup'], kinds),
+                        )
+                    )
+                    self.check_warmup(warmup_stats)
+                stats, elapsed = asyncio.run(
+                    run_load(
+                        transport,
+                        traffic,
+                        options['concurrency'],
+                        options['requests'],
+                        options['duration'],
+                    )
+                )
+            finally:
+                transport.close()
+                request_logger.removeFilter(error_filter)
+                import_module(settings.SESSION_ENGINE).SessionStore(
+                    session_key
+                ).delete()
+
+        self.report(stats, elapsed)
+
+    def check_warmup(self, stats):
+        failed = [
+            f'{kind}: {kind_stats.first_error}'
+            for kind, kind_stats in sorted(stats.items())
+            if not kind_stats.successes
+        ]
+        if failed:
+            raise CommandError(
+                'При прогреве не было ни одного успешного ответа:\n' + '\n'.join(failed)
+            )
+
+    def login(self, options):
+        users = get_user_model().objects.filter(is_superuser=True, is_active=True)
+        if options['username']:
+            users = users.filter(username=options['username'])
+        user = users.order_by('pk').first()
+        if user is None:
+            raise CommandError('Нет суперпользователя, выполните createsuperuser')
+        client = Client()
+        client.force_login(user)
+        return user, client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def report(self, stats, elapsed):
+        total = sum(len(kind_stats.latencies_ms) for kind_stats in stats.values())
+        self.stdout.write(
+            f'Запросов: {total} за {elapsed:.2f} с, {total / elapsed:.1f} запросов/с'
+        )
+        self.stdout.write(
+            f'{"тип":<12}{"всего":>8}{"ошибок":>8}{"p50, мс":>10}{"p90, мс":>10}'
+            f'{"p99, мс":>10}{"max, мс":>10}{"запросов к БД":>15}  статусы'
+        )
+        for kind, kind_stats in sorted(stats.items()):
+            count = len(kind_stats.latencies_ms)
+            if not count:
+                self.stdout.write(f'{kind:<12}{count:>8}{kind_stats.errors:>8}')
+                continue
+            queries = (
+                f'{sum(kind_stats.queries) / len(kind_stats.queries):.1f}'
+                if kind_stats.queries
+                else '-'
+            )
+            statuses = ', '.join(
+                f'{status}: {number}' for status, number in kind_stats.statuses.items()
+            )
+            self.stdout.write(
+                f'{kind:<12}{count:>8}{kind_stats.errors:>8}'
+                f'{kind_stats.percentile(0.5):>10.1f}'
+                f'{kind_stats.percentile(0.9):>10.1f}'
+                f'{kind_stats.percentile(0.99):>10.1f}'
+                f'{max(kind_stats.latencies_ms):>10.1f}{queries:>15}  {statuses}'
+            )
+
+        errors = [
+            (kind, kind_stats.first_error)
+            for kind, kind_stats in sorted(stats.items())
+            if kind_stats.first_error
+        ]
+        if errors:
+            self.stdout.write('Первая ошибка по типам запросов:')
+            for kind, error in errors:
+                self.stdout.write(f'{kind:<12}{error}')
+
+        self.stdout.write('Гистограмма задержек, мс:')
+        bounds = [f'<={bucket}' for bucket in HISTOGRAM_BUCKETS_MS]
+        bounds.append(f'>{HISTOGRAM_BUCKETS_MS[-1]}')
+        self.stdout.write(f'{"тип":<12}' + ''.join(f'{bound:>8}' for bound in bounds))
+        for kind, kind_stats in sorted(stats.items()):
+            self.stdout.write(
+                f'{kind:<12}'
+                + ''.join(f'{number:>8}' for number in kind_stats.histogram())
+            )
@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+SETUP_CODE = 'import django; django.setup()'
+
+ERROR_LINES = 5
+
+
+class Command(BaseCommand):
+    help = 'Время импорта модулей при запуске Django (python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'command',
+            nargs='*',
+            help='Команда manage.py для профилирования, по умолчанию django.setup()',
+        )
+        parser.add_argument(
+            '--settings-module',
+            default=os.environ.get('DJANGO_SETTINGS_MODULE'),
+            help='Модуль настроек для профилируемого процесса',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=30,
+            help='Количество модулей в отчёте',
+        )
+        parser.add_argument(
+            '--sort',
+            choices=('self', 'cumulative'),
+            default='cumulative',
+            help='Сортировка по собственному или накопленному времени импорта',
+        )
+
+    def handle(self, *args, **options):
+        if options['command']:
+            argv = [str(settings.BASE_DIR / 'manage.py'), *options['command']]
+        else:
+            argv = ['-c', SETUP_CODE]
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': options['settings_module']}
+        started = perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', *argv],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = perf_counter() - started
+        if result.returncode:
+            raise CommandError(self.get_error(result))
+
+        imports = self.parse_importtime(result.stderr)
+        key = 1 if options['sort'] == 'self' else 2
+        imports.sort(key=lambda row: row[key], reverse=True)
+        total = sum(row[1] for row in imports)
+
+        self.stdout.write(f'{"модуль":<60} {"self, мс":>10} {"cumul., мс":>12}')
+        for module, self_us, cumulative_us in imports[: options['limit']]:
+            self.stdout.write(
+                f'{module:<60} {self_us / 1000:>10.1f} {cumulative_us / 1000:>12.1f}'
+            )
+        self.stdout.write(
+            f'Модулей: {len(imports)}, импорт: {total / 1000:.1f} мс, '
+            f'процесс целиком: {elapsed * 1000:.1f} мс'
+        )
+
+    @staticmethod
+    def get_error(result: subprocess.CompletedProcess) -> str:
+        # stderr перемешан со строками -X importtime, оставляем только хвост
+        # остального вывода: сообщение команды или конец трассировки.
+        lines = [
+            line
+            for line in result.stderr.splitlines()
+            if line.strip() and not line.startswith('import time:')
+        ]
+        if not lines:
+            return f'Процесс завершился с кодом {result.returncode}'
+        return '\n'.join(lines[-ERROR_LINES:])
+
+    @staticmethod
+    def parse_importtime(output: str) -> list[tuple[str, int, int]]:
+        # Формат строк: "import time:   self [us] | cumulative | imported package"
+        imports = []
+        for line in output.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            self_us, cumulative_us, module = line[len('import time:') :].split('|')
+            if not self_us.strip().isdigit():
+                continue
+            imports.append((module.strip(), int(self_us), int(cumulative_us)))
+        return imports
@@ -0,0 +1,90 @@
+import json
+from time import sleep
+
+from django.core.management import BaseCommand, CommandError
+
+from core.changelog import get_position, iter_changes, prune_changes, set_position
+
+
+class Command(BaseCommand):
+    help = 'Чтение журнала изменений пачками в формате JSON Lines'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--consumer',
+            help='Имя потребителя: курсор читается и сохраняется в базе',
+        )
+        parser.add_argument(
+            '--after',
+            type=int,
+            default=None,
+            help='Начать с изменений с id больше указанного',
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='model_labels',
+            help='Метка модели, например core.Vacancy (можно указать несколько)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Количество изменений в одной пачке',
+        )
+        parser.add_argument(
+            '--follow',
+            action='store_true',
+            help='Не завершаться, а ждать новых изменений',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Пауза между опросами журнала в режиме --follow, в секундах',
+        )
+        parser.add_argument(
+            '--prune',
+            action='store_true',
+            help='Удалить изменения, прочитанные всеми потребителями',
+        )
+
+    def handle(self, *args, **options):
+        consumer = options['consumer']
+        after = options['after']
+        if after is None:
+            after = get_position(consumer) if consumer else 0
+        elif after < 0:
+            raise CommandError('--after не может быть отрицательным')
+
+        try:
+            while True:
+                after = self.tail(after, consumer, options)
+                if options['prune']:
+                    prune_changes()
+                if not options['follow']:
+                    break
+                sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+    def tail(self, after, consumer, options):
+        for changes in iter_changes(
+            after, options['batch_size'], options['model_labels']
+        ):
+            for change in changes:
+                self.stdout.write(
+                    json.dumps(
+                        {
+                            'id': change.id,
+                            'model': change.model,
+                            'object_id': change.object_id,
+                            'action': change.action,
+                            'created_datetime': change.created_datetime.isoformat(),
+                        }
+                    )
+                )
+            after = changes[-1].id
+            if consumer:
+                set_position(consumer, after)
+        return after
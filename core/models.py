@@ -1,8 +1,7 @@
 from datetime import date
 
-from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import NotSupportedError, models, router, transaction
 from django.core.validators import (
     MinLengthValidator,
     RegexValidator,
@@ -19,9 +18,17 @@ password_regex = '^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*\W)[A-Za-z\d\W]{8,}$'
 min_age = 18
 
 
-def min_born_date_validator(born_date: date) -> date | ValidationError:
+def years_ago(years: int) -> date:
     today = date.today()
-    age_18 = today - relativedelta(years=min_age)
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        # 29 февраля, а год назад - не високосный.
+        return today.replace(year=today.year - years, day=28)
+
+
+def min_born_date_validator(born_date: date) -> date | ValidationError:
+    age_18 = years_ago(min_age)
     if born_date > age_18:
         raise ValidationError('Возраст специалиста не может быть меньше 18 лет')
     return born_date
@@ -29,11 +36,98 @@ def min_born_date_validator(born_date: date) -> date | ValidationError:
 
 class DateTimeMixin(models.Model):
     created_datetime = models.DateTimeField(auto_now_add=True)
-    updated_datetime = models.DateTimeField(auto_now=True)
+    updated_datetime = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        abstract = True
+
+
+class ChangeLogQuerySet(models.QuerySet):
+    # Удаления (в том числе каскадные) пишутся в журнал обработчиком
+    # post_delete из core.signals: Collector отправляет его внутри транзакции.
+    # bulk_update вызывает update(), поэтому отдельно не переопределяется.
+
+    def bulk_create(
+        self,
+        objs,
+        batch_size=None,
+        ignore_conflicts=False,
+        update_conflicts=False,
+        update_fields=None,
+        unique_fields=None,
+    ):
+        # При разрешении конфликтов Django не возвращает первичные ключи,
+        # и нельзя узнать, какие строки вставлены, а какие нет.
+        if ignore_conflicts or update_conflicts:
+            raise NotSupportedError(
+                'bulk_create() с ignore_conflicts/update_conflicts не поддерживается '
+                'для моделей с журналом изменений'
+            )
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, batch_size=batch_size)
+            if any(obj.pk is None for obj in objs):
+                # Откатывает вставку: изменения без записи в журнале недопустимы.
+                raise NotSupportedError(
+                    'База данных не вернула первичные ключи из bulk_create()'
+                )
+            ChangeLog.record(
+                self.model,
+                [obj.pk for obj in objs],
+                ChangeLog.CREATE,
+                using=self.db,
+            )
+        return objs
+
+    update_chunk_size = 1000
+
+    def update(self, **kwargs):
+        # Строки блокируются и обновляются пачками по первичному ключу, так что
+        # в журнал попадают ровно те строки, которые изменил UPDATE.
+        rows = 0
+        last_pk = None
+        with transaction.atomic(using=self.db):
+            while True:
+                queryset = self.select_for_update().order_by('pk')
+                if last_pk is not None:
+                    queryset = queryset.filter(pk__gt=last_pk)
+                pks = list(
+                    queryset.values_list('pk', flat=True)[: self.update_chunk_size]
+                )
+                if not pks:
+                    break
+                rows += (
+                    self.model._base_manager.using(self.db)
+                    .filter(pk__in=pks)
+                    .update(**kwargs)
+                )
+                ChangeLog.record(self.model, pks, ChangeLog.UPDATE, using=self.db)
+                last_pk = pks[-1]
+        return rows
+
+
+class ChangeLogMixin(models.Model):
+    objects = ChangeLogQuerySet.as_manager()
 
     class Meta:
         abstract = True
 
+    def save(
+        self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        if update_fields is not None and not update_fields:
+            # Django ничего не пишет в базу, журналировать нечего.
+            return
+        action = ChangeLog.CREATE if self._state.adding else ChangeLog.UPDATE
+        using = using or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(
+                force_insert=force_insert,
+                force_update=force_update,
+                using=using,
+                update_fields=update_fields,
+            )
+            ChangeLog.record(type(self), [self.pk], action, using=using)
+
 
 class Country(models.Model):
     name = models.CharField(
@@ -68,7 +162,7 @@ class Town(models.Model):
         return self.name
 
 
-class Company(DateTimeMixin):
+class Company(ChangeLogMixin, DateTimeMixin):
     login = models.CharField(
         verbose_name='Логин',
         max_length=30,
@@ -129,7 +223,7 @@ class Technology(models.Model):
         return self.name
 
 
-class Specialist(DateTimeMixin):
+class Specialist(ChangeLogMixin, DateTimeMixin):
     login = models.CharField(
         verbose_name='Логин',
         max_length=30,
@@ -174,7 +268,7 @@ class Specialist(DateTimeMixin):
         constraints = [
             models.CheckConstraint(
                 check=models.Q(
-                    born_date__lte=date.today() - relativedelta(years=min_age),
+                    born_date__lte=years_ago(min_age),
                 ),
                 name='born_date_constraint',
             ),
@@ -184,7 +278,7 @@ class Specialist(DateTimeMixin):
         return self.name
 
 
-class Vacancy(DateTimeMixin):
+class AbstractVacancy(models.Model):
     name = models.CharField(
         verbose_name='Должность',
         max_length=100,
@@ -218,14 +312,19 @@ class Vacancy(DateTimeMixin):
     )
 
     class Meta:
-        verbose_name = 'Вакансия'
-        verbose_name_plural = 'Вакансии'
+        abstract = True
 
     def __str__(self):
         return self.name
 
 
-class Resume(DateTimeMixin):
+class Vacancy(ChangeLogMixin, DateTimeMixin, AbstractVacancy):
+    class Meta:
+        verbose_name = 'Вакансия'
+        verbose_name_plural = 'Вакансии'
+
+
+class AbstractResume(models.Model):
     position = models.CharField(
         verbose_name='Должность',
         max_length=150,
@@ -261,13 +360,44 @@ class Resume(DateTimeMixin):
     )
 
     class Meta:
-        verbose_name = 'Резюме'
-        verbose_name_plural = 'Резюме'
+        abstract = True
 
     def __str__(self):
         return self.position
 
 
+class Resume(ChangeLogMixin, DateTimeMixin, AbstractResume):
+    class Meta:
+        verbose_name = 'Резюме'
+        verbose_name_plural = 'Резюме'
+
+
+class ArchiveMixin(models.Model):
+    # Архивная запись сохраняет первичный ключ и даты исходной записи,
+    # поэтому поля не используют auto_now/auto_now_add.
+    id = models.BigIntegerField(primary_key=True)
+    created_datetime = models.DateTimeField()
+    updated_datetime = models.DateTimeField()
+    archived_datetime = models.DateTimeField(
+        verbose_name='Дата и время архивации', auto_now_add=True
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ArchivedVacancy(ArchiveMixin, AbstractVacancy):
+    class Meta:
+        verbose_name = 'Архивная вакансия'
+        verbose_name_plural = 'Архивные вакансии'
+
+
+class ArchivedResume(ArchiveMixin, AbstractResume):
+    class Meta:
+        verbose_name = 'Архивное резюме'
+        verbose_name_plural = 'Архивные резюме'
+
+
 class SpecialistTechnology(models.Model):
     specialist = models.ForeignKey(
         Specialist, verbose_name='Специалист', on_delete=models.CASCADE
@@ -292,3 +422,55 @@ class Token(models.Model):
     token = models.CharField(
         verbose_name='token', max_length=200, validators=[MaxLengthValidator(200)]
     )
+
+
+class ChangeLog(models.Model):
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+    ARCHIVE = 'archive'
+    RESTORE = 'restore'
+    ACTIONS = [
+        (CREATE, 'Создание'),
+        (UPDATE, 'Изменение'),
+        (DELETE, 'Удаление'),
+        (ARCHIVE, 'Перенос в архив'),
+        (RESTORE, 'Возврат из архива'),
+    ]
+
+    model = models.CharField(verbose_name='Модель', max_length=100)
+    object_id = models.BigIntegerField(verbose_name='Идентификатор записи')
+    action = models.CharField(verbose_name='Действие', choices=ACTIONS, max_length=7)
+    created_datetime = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Изменение'
+        verbose_name_plural = 'Журнал изменений'
+        indexes = [models.Index(fields=['model', 'id'])]
+
+    def __str__(self):
+        return f'{self.model} {self.object_id} {self.action}'
+
+    @classmethod
+    def record(
+        cls, model: type[models.Model], pks: list[int], action: str, using=None
+    ) -> None:
+        cls.objects.using(using).bulk_create(
+            objs=(
+                cls(model=model._meta.label, object_id=pk, action=action) for pk in pks
+            ),
+            batch_size=500,
+        )
+
+
+class ChangeLogConsumer(models.Model):
+    name = models.CharField(verbose_name='Потребитель', max_length=100, unique=True)
+    position = models.BigIntegerField(verbose_name='Последнее изменение', default=0)
+    updated_datetime = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Потребитель журнала изменений'
+        verbose_name_plural = 'Потребители журнала изменений'
+
+    def __str__(self):
+        return self.name
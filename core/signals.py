@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.db import models
+from django.db.models.signals import post_delete
+
+from core.models import ChangeLog, ChangeLogMixin
+
+# Модели, удаления которых сейчас не пишутся в журнал как delete.
+unlogged_delete_models = ContextVar('unlogged_delete_models', default=frozenset())
+
+
+@contextmanager
+def skip_delete_log(model: type[models.Model]):
+    '''
+    Внутри блока удаления model не журналируются как delete: вызывающий код
+    сам записывает своё действие (например, archive). Каскадные удаления
+    других моделей журналируются как обычно.
+    '''
+    token = unlogged_delete_models.set(unlogged_delete_models.get() | {model})
+    try:
+        yield
+    finally:
+        unlogged_delete_models.reset(token)
+
+
+def record_delete(sender, instance, using, **kwargs):
+    if sender in unlogged_delete_models.get():
+        return
+    ChangeLog.record(sender, [instance.pk], ChangeLog.DELETE, using=using)
+
+
+def connect_signals():
+    for model in apps.get_app_config('core').get_models():
+        if issubclass(model, ChangeLogMixin):
+            post_delete.connect(
+                record_delete, sender=model, dispatch_uid=f'changelog_{model.__name__}'
+            )
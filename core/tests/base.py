@@ -0,0 +1,53 @@
+from datetime import date
+
+from django.test import TestCase
+
+from core.models import Company, Country, Resume, Specialist, Town, Vacancy
+
+
+class CoreTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.country = Country.objects.create(name='Россия')
+        cls.town = Town.objects.create(name='Москва', country=cls.country)
+        cls.company = Company.objects.create(
+            login='company_login',
+            password='Password1!',
+            name='Компания',
+            country=cls.country,
+            town=cls.town,
+            foundation_date=date(2000, 1, 1),
+            site_href='https://example.com',
+        )
+        cls.specialist = Specialist.objects.create(
+            login='specialist_login',
+            password='Password1!',
+            name='Иван',
+            surname='Иванов',
+            born_date=date(1990, 1, 1),
+            country=cls.country,
+            town=cls.town,
+        )
+
+    def create_vacancy(self, **kwargs) -> Vacancy:
+        return Vacancy.objects.create(
+            **{
+                'name': 'Разработчик',
+                'company': self.company,
+                'town': self.town,
+                'salary': '1000',
+                'description': 'Описание',
+                **kwargs,
+            }
+        )
+
+    def create_resume(self, **kwargs) -> Resume:
+        return Resume.objects.create(
+            **{
+                'position': 'Разработчик',
+                'specialist': self.specialist,
+                'salary': '1000',
+                'description': 'Описание',
+                **kwargs,
+            }
+        )
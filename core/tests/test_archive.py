@@ -0,0 +1,92 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+
+from core.archive import archive_stale, listing, restore
+from core.models import ArchivedVacancy, ChangeLog, Vacancy
+from core.tests.base import CoreTestCase
+
+
+class ArchiveTestCase(CoreTestCase):
+    def setUp(self):
+        self.stale = [self.create_vacancy() for _ in range(3)]
+        self.fresh = self.create_vacancy()
+        old = timezone.now() - timedelta(days=400)
+        Vacancy.objects.filter(pk__in=[vacancy.pk for vacancy in self.stale]).update(
+            created_datetime=old, updated_datetime=old
+        )
+        self.dates = dict(
+            Vacancy.objects.values_list('pk', 'updated_datetime').filter(
+                pk__in=[vacancy.pk for vacancy in self.stale]
+            )
+        )
+
+    def test_archive_and_restore_round_trip(self):
+        pks = sorted(self.dates)
+
+        archived = archive_stale(Vacancy, timedelta(days=180), batch_size=2, pause=0)
+
+        self.assertEqual(archived, 3)
+        self.assertEqual(
+            list(Vacancy.objects.values_list('pk', flat=True)), [self.fresh.pk]
+        )
+        self.assertEqual(
+            sorted(ArchivedVacancy.objects.values_list('pk', flat=True)), pks
+        )
+        self.assertEqual(
+            listing(Vacancy, 'id', include_archived=True).count(), len(pks) + 1
+        )
+
+        self.assertEqual(restore(Vacancy, pks), 3)
+
+        self.assertFalse(ArchivedVacancy.objects.exists())
+        self.assertEqual(
+            sorted(
+                ChangeLog.objects.filter(
+                    action__in=[ChangeLog.ARCHIVE, ChangeLog.RESTORE]
+                ).values_list('action', 'object_id')
+            ),
+            sorted(
+                [(ChangeLog.ARCHIVE, pk) for pk in pks]
+                + [(ChangeLog.RESTORE, pk) for pk in pks]
+            ),
+        )
+        self.assertEqual(
+            dict(
+                Vacancy.objects.values_list('pk', 'updated_datetime').filter(pk__in=pks)
+            ),
+            self.dates,
+        )
+
+    def test_archive_does_not_log_delete(self):
+        archive_stale(Vacancy, timedelta(days=180), pause=0)
+
+        self.assertFalse(ChangeLog.objects.filter(action=ChangeLog.DELETE).exists())
+        self.assertEqual(
+            ChangeLog.objects.filter(action=ChangeLog.ARCHIVE).count(), len(self.dates)
+        )
+
+    def test_delete_after_archive_is_logged(self):
+        archive_stale(Vacancy, timedelta(days=180), pause=0)
+        pk = self.fresh.pk
+
+        self.fresh.delete()
+
+        self.assertEqual(
+            list(
+                ChangeLog.objects.filter(action=ChangeLog.DELETE).values_list(
+                    'object_id', flat=True
+                )
+            ),
+            [pk],
+        )
+
+    def test_max_batches_does_not_sleep_after_last_batch(self):
+        with mock.patch('core.archive.sleep') as sleep:
+            archived = archive_stale(
+                Vacancy, timedelta(days=180), batch_size=2, pause=1, max_batches=1
+            )
+
+        self.assertEqual(archived, 2)
+        sleep.assert_not_called()
@@ -0,0 +1,118 @@
+from unittest import mock
+
+from django.db import NotSupportedError, transaction
+from django.test import override_settings
+
+from core.changelog import consume, get_position, read_changes
+from core.models import ChangeLog, ChangeLogQuerySet, Company, Vacancy
+from core.tests.base import CoreTestCase
+
+
+class Rollback(Exception):
+    pass
+
+
+class ChangeLogTransactionTestCase(CoreTestCase):
+    def setUp(self):
+        self.vacancies = [self.create_vacancy() for _ in range(3)]
+        self.last_id = ChangeLog.objects.latest('id').id
+
+    def new_changes(self):
+        return list(
+            ChangeLog.objects.filter(id__gt=self.last_id).values_list(
+                'model', 'object_id', 'action'
+            )
+        )
+
+    def assert_rolled_back(self, mutate):
+        with self.assertRaises(Rollback):
+            with transaction.atomic():
+                mutate()
+                self.assertTrue(self.new_changes())
+                raise Rollback
+        self.assertEqual(self.new_changes(), [])
+
+    def test_save_rollback(self):
+        vacancy = self.vacancies[0]
+        vacancy.salary = '2000'
+
+        self.assert_rolled_back(vacancy.save)
+        self.assertEqual(Vacancy.objects.get(pk=vacancy.pk).salary, '1000')
+
+    def test_update_rollback(self):
+        self.assert_rolled_back(lambda: Vacancy.objects.update(salary='2000'))
+        self.assertFalse(Vacancy.objects.filter(salary='2000').exists())
+
+    def test_bulk_update_rollback(self):
+        for vacancy in self.vacancies:
+            vacancy.salary = '2000'
+
+        self.assert_rolled_back(
+            lambda: Vacancy.objects.bulk_update(self.vacancies, ['salary'])
+        )
+        self.assertFalse(Vacancy.objects.filter(salary='2000').exists())
+
+    def test_cascading_delete_rollback(self):
+        self.assert_rolled_back(self.company.delete)
+        self.assertEqual(Vacancy.objects.count(), len(self.vacancies))
+
+    def test_cascading_delete_logs_every_row(self):
+        company_pk = self.company.pk
+        self.company.delete()
+
+        changes = self.new_changes()
+        self.assertIn(('core.Company', company_pk, ChangeLog.DELETE), changes)
+        for vacancy in self.vacancies:
+            self.assertIn(('core.Vacancy', vacancy.pk, ChangeLog.DELETE), changes)
+
+    @mock.patch.object(ChangeLogQuerySet, 'update_chunk_size', 2)
+    def test_update_logs_updated_rows_in_chunks(self):
+        rows = Vacancy.objects.update(salary='2000')
+
+        self.assertEqual(rows, len(self.vacancies))
+        self.assertEqual(
+            sorted(object_id for _, object_id, _ in self.new_changes()),
+            [vacancy.pk for vacancy in self.vacancies],
+        )
+
+    def test_save_with_empty_update_fields_is_not_logged(self):
+        self.vacancies[0].save(update_fields=[])
+
+        self.assertEqual(self.new_changes(), [])
+
+    def test_bulk_create_ignore_conflicts_is_rejected(self):
+        with self.assertRaises(NotSupportedError):
+            Company.objects.bulk_create([self.company], ignore_conflicts=True)
+
+        self.assertEqual(self.new_changes(), [])
+
+
+@override_settings(CHANGELOG_COMMIT_LAG=0)
+class ConsumeTestCase(CoreTestCase):
+    def setUp(self):
+        for _ in range(3):
+            self.create_vacancy()
+        self.change_ids = list(ChangeLog.objects.values_list('id', flat=True))
+
+    def test_consume_resumes_after_handler_error(self):
+        handled = []
+
+        def handler(changes):
+            if len(handled) == 2:
+                raise Rollback
+            handled.extend(change.id for change in changes)
+
+        with self.assertRaises(Rollback):
+            consume('indexer', handler, batch_size=1)
+
+        self.assertEqual(get_position('indexer'), handled[-1])
+
+        resumed = []
+        consume('indexer', lambda changes: resumed.extend(c.id for c in changes))
+
+        self.assertEqual(handled + resumed, self.change_ids)
+        self.assertEqual(get_position('indexer'), self.change_ids[-1])
+
+    @override_settings(CHANGELOG_COMMIT_LAG=60)
+    def test_recent_changes_are_held_back(self):
+        self.assertEqual(read_changes(), [])
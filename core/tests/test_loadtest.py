@@ -0,0 +1,142 @@
+import logging
+
+from asgiref.sync import async_to_sync
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.asgi import get_asgi_application
+from django.test import Client, SimpleTestCase, override_settings
+
+from core.loadtest import (
+    HISTOGRAM_BUCKETS_MS,
+    ASGITransport,
+    FirstErrorFilter,
+    Stats,
+    TrafficMix,
+    parse_mix,
+    preserved_data,
+    run_load,
+)
+from core.models import ChangeLog, Vacancy
+from core.tests.base import CoreTestCase
+
+
+class ParseMixTestCase(SimpleTestCase):
+    def test_parse(self):
+        self.assertEqual(parse_mix('listing=4, write=1'), {'listing': 4, 'write': 1})
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            parse_mix('listing=1,delete=1')
+
+    def test_all_zero_weights(self):
+        with self.assertRaises(ValueError):
+            parse_mix('listing=0,write=0')
+
+
+class StatsTestCase(SimpleTestCase):
+    def test_percentile(self):
+        stats = Stats(latencies_ms=[float(value) for value in range(10, 0, -1)])
+
+        self.assertEqual(stats.percentile(0), 1)
+        self.assertEqual(stats.percentile(0.5), 6)
+        self.assertEqual(stats.percentile(0.99), 10)
+        self.assertEqual(stats.percentile(1), 10)
+
+    def test_histogram_bucket_edges(self):
+        stats = Stats(latencies_ms=[0.5, 1, 1.01, 5, 5000, 5000.01])
+
+        histogram = stats.histogram()
+
+        self.assertEqual(len(histogram), len(HISTOGRAM_BUCKETS_MS) + 1)
+        # Граница включается в свой интервал: 1 -> "<=1", 1.01 -> "<=2".
+        self.assertEqual(histogram[0], 2)
+        self.assertEqual(histogram[1], 1)
+        self.assertEqual(histogram[HISTOGRAM_BUCKETS_MS.index(5)], 1)
+        self.assertEqual(histogram[-2], 1)
+        self.assertEqual(histogram[-1], 1)
+
+
+class FirstErrorFilterTestCase(SimpleTestCase):
+    def make_record(self, message, exc_info=None):
+        return logging.LogRecord(
+            'django.request', logging.WARNING, __file__, 0, message, (), exc_info
+        )
+
+    def test_records_are_deduplicated(self):
+        error_filter = FirstErrorFilter()
+        error = ValueError('boom')
+        exc_info = (ValueError, error, None)
+
+        self.assertTrue(error_filter.filter(self.make_record('Not Found: /a')))
+        self.assertFalse(error_filter.filter(self.make_record('Not Found: /a')))
+        self.assertTrue(error_filter.filter(self.make_record('Not Found: /b')))
+        self.assertTrue(error_filter.filter(self.make_record('Error: /a', exc_info)))
+        self.assertFalse(error_filter.filter(self.make_record('Error: /b', exc_info)))
+
+
+class LoadTestCase(CoreTestCase):
+    def setUp(self):
+        self.vacancies = [self.create_vacancy() for _ in range(3)]
+        self.resume = self.create_resume()
+        self.user = get_user_model().objects.create_superuser(
+            'admin', 'admin@example.com', 'password'
+        )
+        client = Client()
+        client.force_login(self.user)
+        self.session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def test_preserved_data_restores_written_vacancies(self):
+        traffic = TrafficMix({'write': 1}, seed=1)
+        changes = ChangeLog.objects.count()
+        other_admin = get_user_model().objects.create_superuser(
+            'other', 'other@example.com', 'password'
+        )
+
+        with preserved_data(traffic, self.user):
+            for _ in range(5):
+                traffic.make_write()
+            Vacancy.objects.filter(pk__in=traffic.written).update(
+                salary='5', salary_currency='USD'
+            )
+            for user in (self.user, other_admin):
+                LogEntry.objects.log_action(
+                    user.pk, None, self.vacancies[0].pk, 'vacancy', CHANGE
+                )
+
+        self.assertEqual(
+            set(Vacancy.objects.values_list('salary', 'salary_currency')),
+            {('1000', 'RUB')},
+        )
+        # Возврат журналируется, записи журнала не удаляются.
+        self.assertEqual(ChangeLog.objects.count(), changes + 2 * len(traffic.written))
+        self.assertEqual(
+            list(LogEntry.objects.values_list('user', flat=True)), [other_admin.pk]
+        )
+
+    def test_run_load_in_process(self):
+        traffic = TrafficMix(
+            {'changelist': 1, 'listing': 1, 'search': 1, 'detail': 1, 'write': 1},
+            seed=1,
+        )
+        headers = {'Cookie': f'{settings.SESSION_COOKIE_NAME}={self.session_key}'}
+
+        with override_settings(
+            ALLOWED_HOSTS=['localhost'],
+            MIDDLEWARE=['core.loadtest.QueryCountMiddleware', *settings.MIDDLEWARE],
+        ):
+            transport = ASGITransport(get_asgi_application(), headers)
+            traffic.cover_all()
+            stats, elapsed = async_to_sync(run_load)(transport, traffic, 2, 20)
+
+        self.assertEqual(
+            set(stats), {'changelist', 'listing', 'search', 'detail', 'write'}
+        )
+        self.assertGreater(elapsed, 0)
+        for kind, kind_stats in stats.items():
+            with self.subTest(kind=kind):
+                expected = 302 if kind == 'write' else 200
+                self.assertEqual(set(kind_stats.statuses), {expected})
+                self.assertEqual(kind_stats.errors, 0)
+                self.assertEqual(len(kind_stats.queries), len(kind_stats.latencies_ms))
+                self.assertTrue(all(queries > 0 for queries in kind_stats.queries))
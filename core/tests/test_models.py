@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from core.models import min_age, min_born_date_validator, years_ago
+
+
+def fake_today(today: date):
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day)
+
+    return mock.patch('core.models.date', FakeDate)
+
+
+class YearsAgoTestCase(SimpleTestCase):
+    def test_regular_day(self):
+        with fake_today(date(2024, 3, 1)):
+            self.assertEqual(years_ago(18), date(2006, 3, 1))
+
+    def test_february_29_in_non_leap_year(self):
+        with fake_today(date(2024, 2, 29)):
+            self.assertEqual(years_ago(18), date(2006, 2, 28))
+
+    def test_february_29_in_leap_year(self):
+        with fake_today(date(2024, 2, 29)):
+            self.assertEqual(years_ago(4), date(2020, 2, 29))
+
+
+class MinBornDateValidatorTestCase(SimpleTestCase):
+    def test_exactly_min_age_passes(self):
+        born_date = years_ago(min_age)
+
+        self.assertEqual(min_born_date_validator(born_date), born_date)
+
+    def test_younger_than_min_age_fails(self):
+        with self.assertRaises(ValidationError):
+            min_born_date_validator(years_ago(min_age) + timedelta(days=1))
@@ -0,0 +1,37 @@
+import subprocess
+
+from django.test import SimpleTestCase
+
+from core.management.commands.profile_startup import Command
+
+IMPORTTIME_SAMPLE = '''\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        61 |         61 | gc
+import time:      1500 |       1681 | django
+'''
+
+
+class ProfileStartupTestCase(SimpleTestCase):
+    def test_parse_importtime_skips_header(self):
+        self.assertEqual(
+            Command.parse_importtime(IMPORTTIME_SAMPLE),
+            [('_io', 120, 120), ('gc', 61, 61), ('django', 1500, 1681)],
+        )
+
+    def test_get_error_skips_importtime_lines(self):
+        result = subprocess.CompletedProcess(
+            args=[],
+            returncode=1,
+            stderr=IMPORTTIME_SAMPLE.replace(
+                'import time:        61',
+                "Unknown command: 'nosuchcmd'\nimport time: 61",
+            ),
+        )
+
+        self.assertEqual(Command.get_error(result), "Unknown command: 'nosuchcmd'")
+
+    def test_get_error_without_output(self):
+        result = subprocess.CompletedProcess(args=[], returncode=2, stderr='')
+
+        self.assertEqual(Command.get_error(result), 'Процесс завершился с кодом 2')
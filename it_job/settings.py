@@ -14,14 +14,17 @@ from pathlib import (
     Path,
 )
 
-from dotenv import (
-    load_dotenv,
-)
-
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-load_dotenv(dotenv_path=Path(BASE_DIR, '.env'))
+# python-dotenv is only imported when there is a .env file to read, so
+# processes that get their environment from the outside start faster.
+if Path(BASE_DIR, '.env').exists():
+    from dotenv import (
+        load_dotenv,
+    )
+
+    load_dotenv(dotenv_path=Path(BASE_DIR, '.env'))
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
@@ -136,3 +139,19 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Archiving of stale vacancies and resumes
+
+ARCHIVE_RETENTION_DAYS = int(os.getenv('ARCHIVE_RETENTION_DAYS', 180))
+
+ARCHIVE_BATCH_SIZE = int(os.getenv('ARCHIVE_BATCH_SIZE', 500))
+
+ARCHIVE_BATCH_PAUSE = float(os.getenv('ARCHIVE_BATCH_PAUSE', 0.1))
+
+
+# Change log (outbox) of core model mutations
+
+# Entries younger than this many seconds are not handed to consumers, so that
+# transactions committing out of id order are not skipped by the cursor.
+CHANGELOG_COMMIT_LAG = float(os.getenv('CHANGELOG_COMMIT_LAG', 5))
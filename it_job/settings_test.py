@@ -0,0 +1,14 @@
+"""
+Django settings for running the it_job test suite.
+
+Usage:
+    python manage.py test --settings it_job.settings_test
+
+Migrations for core are not kept in the repository, so test tables for it
+are created directly from the models.
+"""
+from it_job.settings import *  # noqa: F401, F403
+
+MIGRATION_MODULES = {'core': None}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
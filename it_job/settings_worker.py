@@ -0,0 +1,28 @@
+"""
+Slim Django settings for management commands and background workers.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=it_job.settings_worker python manage.py <command>
+
+Admin, sessions, messages, templates and middleware are not needed outside
+of the web process, so they are left out to shorten startup of short-lived
+processes.
+"""
+from it_job.settings import *  # noqa: F401, F403
+from it_job.settings import (
+    INSTALLED_APPS,
+)
+
+WORKER_EXCLUDED_APPS = (
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+)
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in WORKER_EXCLUDED_APPS]
+
+MIDDLEWARE = []
+
+ROOT_URLCONF = 'it_job.urls_worker'
+
+TEMPLATES = []
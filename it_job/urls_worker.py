@@ -0,0 +1,7 @@
+"""
+URL configuration for it_job worker processes.
+
+Workers do not serve HTTP requests, see it_job.settings_worker.
+"""
+
+urlpatterns = []